@@ -6,7 +6,9 @@ from benchmarks.common import (
     BenchmarkSummary,
     Driver,
     Framework,
+    QueueDrainListener,
     ResourceMonitor,
+    SyncResourceMonitor,
     TaskTiming,
     Timer,
 )
@@ -17,7 +19,9 @@ __all__ = [
     "BenchmarkSummary",
     "Driver",
     "Framework",
+    "QueueDrainListener",
     "ResourceMonitor",
+    "SyncResourceMonitor",
     "TaskTiming",
     "Timer",
 ]
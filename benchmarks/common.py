@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
+import contextlib
+import ctypes
 from dataclasses import dataclass, field
 from enum import Enum
+import gc
 import itertools
 import math
 import os
 import statistics
+import sys
+import threading
 import time
 from typing import Any
 
 from hdrhistogram import HdrHistogram
+import numpy as np
 import psutil
 
 
@@ -34,9 +41,9 @@ class Driver(str, Enum):
     REDIS = "redis"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkConfig:
-    """Configuration for a benchmark run."""
+    """Configuration for a benchmark run (immutable; derive variants with ``replace``)."""
 
     framework: Framework
     scenario_id: str = ""
@@ -74,6 +81,7 @@ class WorkerConfig:
     autoscale: tuple[int, int] | None = None  # max, min
     extra_args: list[str] = field(default_factory=list)
     description: str = ""
+    ready_timeout: float = 10.0  # max seconds to wait for workers to report ready
 
 
 @dataclass(frozen=True)
@@ -87,6 +95,7 @@ class ScenarioDefinition:
     task_count: int
     worker_count: int
     warmup_seconds: int = 0
+    dry_run_tasks: int = 100  # untimed warm-up run before the measured runs (0 disables)
     tags: tuple[str, ...] = ()
     requirements: tuple[str, ...] = ()
     implemented: bool = True
@@ -318,6 +327,90 @@ class BenchmarkSummary:
         }
 
 
+# Enqueue loops timestamp every Nth dispatch and interpolate the rest
+ENQUEUE_SAMPLE_STRIDE = 64
+
+# Multiply RSS bytes by this to get MB (one multiply instead of two divisions)
+BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+
+def interpolate_task_timings(
+    task_ids: list[str], checkpoints: list[tuple[int, float]]
+) -> list[TaskTiming]:
+    """Build task timings with enqueue times interpolated between checkpoints.
+
+    Args:
+        task_ids: Task IDs in enqueue order
+        checkpoints: (task_index, timestamp) pairs recorded before dispatching
+            that index, plus a final (len(task_ids), enqueue_end) pair
+
+    Returns:
+        One TaskTiming per task ID
+    """
+    if not task_ids:
+        return []
+
+    indices, timestamps = zip(*checkpoints, strict=True)
+    enqueue_times = np.interp(np.arange(len(task_ids)), indices, timestamps)
+    return [
+        TaskTiming(task_id=task_id, enqueue_time=enqueue_time)
+        for task_id, enqueue_time in zip(task_ids, enqueue_times.tolist(), strict=True)
+    ]
+
+
+def estimate_task_timings(
+    task_timings: list[TaskTiming],
+    queue_depth_samples: list[tuple[float, int]],
+    processing_start: float,
+    processing_end: float,
+    execution_estimate: float,
+) -> None:
+    """Fill in estimated start/complete times for every task in place.
+
+    Without worker instrumentation, tasks are assumed to finish in FIFO order:
+    task ``i`` completes at the first queue depth sample that drained to
+    ``total - i - 1``. The samples are converted to arrays once and searched in
+    a single vectorized pass instead of rescanning them for every task.
+
+    Args:
+        task_timings: Timings recorded at enqueue time (mutated in place)
+        queue_depth_samples: (timestamp, depth) pairs collected while polling
+        processing_start: Timestamp when the processing wait began
+        processing_end: Timestamp when the processing wait ended
+        execution_estimate: Assumed per-task execution time in seconds
+    """
+    processing_duration = processing_end - processing_start
+
+    if processing_duration > 0 and task_timings and len(queue_depth_samples) > 2:
+        samples = np.asarray(queue_depth_samples, dtype=np.float64)
+        timestamps = samples[:, 0]
+        # Running minimum makes "first sample at or below target" a sorted search
+        drained = -np.minimum.accumulate(samples[:, 1])
+        targets = -np.arange(len(task_timings) - 1, -1, -1, dtype=np.float64)
+        indices = np.searchsorted(drained, targets, side="left")
+        # Targets never reached fall back to the first sample
+        indices[indices == len(timestamps)] = 0
+
+        complete_times = timestamps[indices]
+        start_times = np.maximum(complete_times - execution_estimate, processing_start)
+        for timing, complete_time, start_time in zip(
+            task_timings, complete_times.tolist(), start_times.tolist(), strict=True
+        ):
+            timing.complete_time = complete_time
+            timing.start_time = start_time
+    elif processing_duration > 0 and task_timings:
+        # Fallback: distribute evenly if no queue depth data
+        time_per_task = processing_duration / len(task_timings)
+        for i, timing in enumerate(task_timings):
+            timing.start_time = processing_start + (i * time_per_task * 0.9)
+            timing.complete_time = processing_start + ((i + 1) * time_per_task)
+    else:
+        # Worst case fallback: all tasks complete at end (latency will be high)
+        for timing in task_timings:
+            timing.start_time = processing_start
+            timing.complete_time = processing_end
+
+
 class Timer:
     """Context manager for timing operations."""
 
@@ -337,6 +430,18 @@ class Timer:
         self.elapsed = self.end_time - self.start_time
 
 
+def release_memory() -> None:
+    """Collect garbage and return freed heap pages to the OS where supported.
+
+    Call before long waits so RSS samples reflect live data rather than
+    buffers that are no longer referenced (glibc otherwise keeps them mapped).
+    """
+    gc.collect()
+    if sys.platform.startswith("linux"):
+        with contextlib.suppress(OSError, AttributeError):
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+
+
 class ResourceMonitor:
     """Monitor CPU and memory usage during benchmark execution.
 
@@ -371,8 +476,8 @@ class ResourceMonitor:
         if self._task:
             await self._task
 
-        avg_cpu = statistics.mean(self.cpu_samples) if self.cpu_samples else 0.0
-        avg_memory = statistics.mean(self.memory_samples) if self.memory_samples else 0.0
+        avg_cpu = statistics.fmean(self.cpu_samples) if self.cpu_samples else 0.0
+        avg_memory = statistics.fmean(self.memory_samples) if self.memory_samples else 0.0
 
         return avg_cpu, avg_memory
 
@@ -393,7 +498,7 @@ class ResourceMonitor:
 
                 # Memory in MB
                 memory_info = self.process.memory_info()
-                memory_mb = memory_info.rss / 1024 / 1024
+                memory_mb = memory_info.rss * BYTES_TO_MB
                 self.memory_samples.append(memory_mb)
 
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -410,3 +515,175 @@ class ResourceMonitor:
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
         await self.stop()
+
+
+class QueueDrainListener:
+    """Wake completion pollers as soon as Redis reports that a queue was emptied.
+
+    Subscribes to keyspace notifications for the given AsyncTasQ queues and
+    signals whenever one of their keys is deleted (Redis removes a list or
+    sorted set once its last element is popped). Requires
+    ``notify-keyspace-events`` to include ``Kg`` (see docker-compose.yml);
+    when notifications are unavailable the listener never fires and callers
+    fall back to their regular poll cadence.
+    """
+
+    def __init__(self, client: Any, queues: Iterable[str]) -> None:
+        """Initialize drain listener.
+
+        Args:
+            client: Async Redis client used by the AsyncTasQ driver
+            queues: Queue names whose pending/processing keys should be watched
+        """
+        self.client = client
+        db = client.connection_pool.connection_kwargs.get("db", 0) if client else 0
+        self.channels = [
+            f"__keyspace@{db}__:queue:{queue}{suffix}"
+            for queue in queues
+            for suffix in ("", ":processing")
+        ]
+        self._drained = asyncio.Event()
+        self._pubsub: Any = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Subscribe to keyspace notifications in background."""
+        if self.client is None:
+            return
+        try:
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(*self.channels)
+        except Exception:
+            # Polling still works without notifications
+            self._pubsub = None
+            return
+        self._task = asyncio.create_task(self._listen())
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a drain notification.
+
+        Returns:
+            True if woken by a notification, False if the timeout elapsed
+        """
+        return await self.wait_until(asyncio.get_running_loop().time() + timeout)
+
+    async def wait_until(self, when: float) -> bool:
+        """Wait for a drain notification until the absolute loop time ``when``.
+
+        Scheduling against an absolute deadline keeps poll ticks aligned to the
+        monotonic clock instead of drifting by however late each wake-up was.
+
+        Returns:
+            True if woken by a notification, False if the deadline passed
+        """
+        try:
+            async with asyncio.timeout_at(when):
+                await self._drained.wait()
+        except TimeoutError:
+            return False
+        self._drained.clear()
+        return True
+
+    async def stop(self) -> None:
+        """Stop listening and release the pub/sub connection."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._pubsub:
+            with contextlib.suppress(Exception):
+                await self._pubsub.aclose()
+
+    async def _listen(self) -> None:
+        """Background loop translating ``del`` notifications into wake-ups."""
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("data") in (b"del", "del"):
+                    self._drained.set()
+        except Exception:
+            # Connection lost - callers keep polling on their own cadence
+            pass
+
+    async def __aenter__(self) -> QueueDrainListener:
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.stop()
+
+
+class SyncResourceMonitor:
+    """Thread-based counterpart of ResourceMonitor for synchronous benchmark paths.
+
+    Samples CPU and memory on a daemon thread so blocking poll loops (Celery)
+    don't pay for the psutil syscalls between broker checks.
+    """
+
+    def __init__(self, interval_seconds: float = 0.5) -> None:
+        """Initialize resource monitor.
+
+        Args:
+            interval_seconds: How often to sample resource usage (default: 0.5s)
+        """
+        self.interval_seconds = interval_seconds
+        self.process = psutil.Process(os.getpid())
+        self.cpu_samples: list[float] = []
+        self.memory_samples: list[float] = []
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start monitoring resource usage in a background thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._monitor_loop, name="sync-resource-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> tuple[float, float]:
+        """Stop monitoring and return average metrics.
+
+        Returns:
+            Tuple of (average_cpu_percent, average_memory_mb)
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+
+        avg_cpu = statistics.fmean(self.cpu_samples) if self.cpu_samples else 0.0
+        avg_memory = statistics.fmean(self.memory_samples) if self.memory_samples else 0.0
+
+        return avg_cpu, avg_memory
+
+    def _monitor_loop(self) -> None:
+        """Background loop to sample resource usage."""
+        # Initial sample to "warm up" cpu_percent (first call returns 0.0)
+        self.process.cpu_percent(interval=None)
+
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                # CPU percent (per-core, so can exceed 100%)
+                cpu = self.process.cpu_percent(interval=None)
+
+                # Only include non-zero CPU samples (skip initial warmup)
+                if cpu > 0.0 or len(self.cpu_samples) > 0:
+                    self.cpu_samples.append(cpu)
+
+                # Memory in MB
+                memory_info = self.process.memory_info()
+                self.memory_samples.append(memory_info.rss * BYTES_TO_MB)
+
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # Process may have terminated
+                break
+
+    def __enter__(self) -> SyncResourceMonitor:
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.stop()
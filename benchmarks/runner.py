@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections.abc import Callable
+import dataclasses
 import json
 import os
 from pathlib import Path
@@ -25,7 +27,6 @@ from rich.table import Table
 from benchmarks.common import BenchmarkConfig, BenchmarkSummary, Driver, Framework
 from benchmarks.scenario_registry import (
     get_scenario_definition,
-    implemented_scenarios,
     scenario_choices,
 )
 from benchmarks.worker_manager import WorkerManager
@@ -116,6 +117,18 @@ async def run_scenario(
                 "[yellow]⚠ No worker profile found; assuming manual worker startup.[/yellow]"
             )
 
+    if scenario_metadata.dry_run_tasks:
+        # Untimed dry run warms imports, broker/HTTP connections and worker pools so run 1
+        # isn't penalized by cold starts; its result is discarded
+        console.print(
+            f"[dim]Dry run with {scenario_metadata.dry_run_tasks} tasks (not recorded)...[/dim]"
+        )
+        await module.run_benchmark(
+            dataclasses.replace(
+                config, task_count=scenario_metadata.dry_run_tasks, warmup_seconds=0
+            )
+        )
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -126,8 +139,7 @@ async def run_scenario(
         for run in range(1, runs + 1):
             progress.update(task, description=f"Run {run}/{runs}")
 
-            config.runs = run
-            result = await module.run_benchmark(config)
+            result = await module.run_benchmark(dataclasses.replace(config, runs=run))
             results.append(result)
 
             progress.advance(task)
@@ -274,8 +286,7 @@ def save_results(summaries: list[BenchmarkSummary], output_dir: Path) -> None:
         filename = f"scenario_{scenario_id}_{framework}_{driver}.json"
         filepath = output_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(summary.to_dict(), f, indent=2)
+        filepath.write_text(json.dumps(summary.to_dict(), indent=2), encoding="utf-8")
 
         console.print(f"[green]✓[/green] Saved results to {filepath}")
 
@@ -341,11 +352,10 @@ async def main() -> int:
         return 0
 
     # Determine scenarios to run
-    available = implemented_scenarios()
     if args.scenario:
         scenario_ids = [args.scenario]
     else:
-        scenario_ids = list(available.keys()) if args.all else list(available.keys())
+        scenario_ids = list(scenario_choices())
 
     # Determine frameworks to test
     if args.framework == "both":
@@ -409,5 +419,15 @@ async def main() -> int:
     return 0
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when available, else use the stdlib loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    # Scenario modules are imported inside main(), so the loop must be chosen here
+    sys.exit(asyncio.run(main(), loop_factory=_event_loop_factory()))
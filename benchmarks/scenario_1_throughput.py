@@ -15,7 +15,19 @@ if TYPE_CHECKING:
 
 import psutil
 
-from benchmarks.common import BenchmarkResult, Framework, ResourceMonitor, TaskTiming, Timer
+from benchmarks.common import (
+    BYTES_TO_MB,
+    BenchmarkResult,
+    Framework,
+    ResourceMonitor,
+    TaskTiming,
+    Timer,
+    estimate_task_timings,
+    interpolate_task_timings,
+)
+
+# Celery tasks are published in groups of this size over one producer/connection
+CELERY_ENQUEUE_BATCH = 500
 
 
 async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
@@ -162,41 +174,9 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
     # Stop resource monitoring and get averages
     avg_cpu, avg_memory = await monitor.stop()
 
-    # Estimate task completion times
-    # NOTE: Without worker instrumentation, we use queue depth samples to estimate
-    # when tasks completed. This is more accurate than linear distribution.
-    if processing_duration > 0 and len(task_timings) > 0 and len(queue_depth_samples) > 2:
-        # Use queue depth samples to estimate completion times
-        # Tasks complete as queue drains, not linearly
-        total_tasks = len(task_timings)
-
-        for i, timing in enumerate(task_timings):
-            # Find the queue depth sample when this task likely completed
-            # Assumes FIFO order: task i completes when queue drained to (total - i)
-            target_depth = total_tasks - i - 1
-
-            # Find closest queue depth sample
-            closest_sample = queue_depth_samples[0]
-            for timestamp, depth in queue_depth_samples:
-                if depth <= target_depth:
-                    closest_sample = (timestamp, depth)
-                    break
-
-            # Estimate: task started slightly before completion (assume 10ms execution)
-            timing.complete_time = closest_sample[0]
-            timing.start_time = max(processing_start, timing.complete_time - 0.01)
-    elif processing_duration > 0 and len(task_timings) > 0:
-        # Fallback: distribute evenly if no queue depth data
-        # This is less accurate but better than nothing
-        time_per_task = processing_duration / len(task_timings)
-        for i, timing in enumerate(task_timings):
-            timing.start_time = processing_start + (i * time_per_task * 0.9)
-            timing.complete_time = processing_start + ((i + 1) * time_per_task)
-    else:
-        # Worst case fallback: all tasks complete at end (latency will be high)
-        for timing in task_timings:
-            timing.start_time = processing_start
-            timing.complete_time = processing_end
+    # Estimate task completion times from queue depth samples
+    # (assume 10ms execution)
+    estimate_task_timings(task_timings, queue_depth_samples, processing_start, processing_end, 0.01)
 
     total_time = enqueue_duration + processing_duration
 
@@ -227,6 +207,7 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
     Returns:
         Benchmark results
     """
+    from celery import group
     from kombu import Connection
 
     from tasks.celery_tasks import app, noop_task
@@ -234,8 +215,6 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
     if config.warmup_seconds:
         time.sleep(config.warmup_seconds)
 
-    task_timings: list[TaskTiming] = []
-
     # Start resource monitoring
     # NOTE: This monitors the benchmark script process, NOT the Celery worker processes.
     # For true worker resource usage, monitor worker PIDs separately.
@@ -246,16 +225,19 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
     memory_samples: list[float] = []
 
     # Enqueue all tasks (don't store results - task has ignore_result=True)
+    task_ids: list[str] = []
+    checkpoints: list[tuple[int, float]] = []
+
     with Timer() as enqueue_timer:
-        for i in range(config.task_count):
-            enqueue_time = time.perf_counter()
-            result = noop_task.delay()
-            task_timings.append(
-                TaskTiming(
-                    task_id=result.id if hasattr(result, "id") else f"task_{i}",
-                    enqueue_time=enqueue_time,
-                )
-            )
+        for batch_start in range(0, config.task_count, CELERY_ENQUEUE_BATCH):
+            batch_size = min(CELERY_ENQUEUE_BATCH, config.task_count - batch_start)
+            checkpoints.append((batch_start, time.perf_counter()))
+            batch = group(noop_task.s() for _ in range(batch_size)).apply_async()
+            task_ids.extend(result.id for result in batch.results)
+
+    # Spread each group's tasks across its publish window rather than stamping the group start
+    checkpoints.append((config.task_count, enqueue_timer.end_time))
+    task_timings = interpolate_task_timings(task_ids, checkpoints)
 
     # Wait for all tasks to complete by polling queue depth
     queue_depth_samples: list[tuple[float, int]] = []
@@ -274,7 +256,7 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
             while (time.perf_counter() - start) < timeout:
                 # Sample resources
                 cpu_samples.append(process.cpu_percent())
-                memory_samples.append(process.memory_info().rss / 1024 / 1024)
+                memory_samples.append(process.memory_info().rss * BYTES_TO_MB)
 
                 # Check queue depth - when it's 0, all tasks are consumed
                 try:
@@ -307,7 +289,6 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
                 time.sleep(poll_interval)
 
         processing_end = time.perf_counter()
-        processing_duration = processing_timer.elapsed
 
     # Calculate average resource usage
     avg_cpu = sum(cpu_samples) / len(cpu_samples) if cpu_samples else 0.0
@@ -317,34 +298,9 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
     completed = config.task_count
     failed = 0
 
-    # Estimate task completion times using queue depth samples
-    # NOTE: Without worker instrumentation, we use queue depth to estimate completion
-    if processing_duration > 0 and len(task_timings) > 0 and len(queue_depth_samples) > 2:
-        # Use queue depth samples to estimate completion times
-        total_tasks = len(task_timings)
-
-        for i, timing in enumerate(task_timings):
-            # Find queue depth sample when this task likely completed
-            target_depth = total_tasks - i - 1
-
-            closest_sample = queue_depth_samples[0]
-            for timestamp, depth in queue_depth_samples:
-                if depth <= target_depth:
-                    closest_sample = (timestamp, depth)
-                    break
-
-            timing.complete_time = closest_sample[0]
-            timing.start_time = max(processing_start, timing.complete_time - 0.01)
-    elif processing_duration > 0 and len(task_timings) > 0:
-        # Fallback: distribute evenly
-        time_per_task = processing_duration / len(task_timings)
-        for i, timing in enumerate(task_timings):
-            timing.start_time = processing_start + (i * time_per_task * 0.9)
-            timing.complete_time = processing_start + ((i + 1) * time_per_task)
-    else:
-        for timing in task_timings:
-            timing.start_time = processing_start
-            timing.complete_time = processing_end
+    # Estimate task completion times from queue depth samples
+    # (assume 10ms execution)
+    estimate_task_timings(task_timings, queue_depth_samples, processing_start, processing_end, 0.01)
 
     total_time = enqueue_timer.elapsed + processing_timer.elapsed
 
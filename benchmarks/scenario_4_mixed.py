@@ -7,37 +7,50 @@ Captures the blended workloads most production queues handle day-to-day.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
-import random
 import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from benchmarks.common import BenchmarkConfig, BenchmarkResult
 
-import psutil
+import numpy as np
 
-from benchmarks.common import BenchmarkResult, Framework, ResourceMonitor, TaskTiming, Timer
+from benchmarks.common import (
+    ENQUEUE_SAMPLE_STRIDE,
+    BenchmarkResult,
+    Framework,
+    QueueDrainListener,
+    ResourceMonitor,
+    SyncResourceMonitor,
+    Timer,
+    estimate_task_timings,
+    interpolate_task_timings,
+)
 
 MIX_RATIO = {
     "io": 0.6,
     "cpu_light": 0.3,
     "cpu_heavy": 0.1,
 }
+LABELS = tuple(MIX_RATIO)
 HEAVY_PAYLOAD = b"x" * (2 * 1024 * 1024)  # 2MB payload keeps memory in check
+# Heavy tasks reference the payload by key; it is uploaded to Redis once per run
+HEAVY_PAYLOAD_KEY = f"bench:heavy:{hashlib.sha1(HEAVY_PAYLOAD).hexdigest()[:12]}"
+HEAVY_PAYLOAD_TTL_SECONDS = 600
 LIGHT_JSON = json.dumps({"items": list(range(25)), "meta": {"active": True}})
 
 
-def _build_task_plan(total_tasks: int, seed: int = 42) -> list[str]:
-    """Return a shuffled plan honoring the configured ratios."""
+def _build_task_plan(total_tasks: int, seed: int = 42) -> np.ndarray:
+    """Return a shuffled plan of ``LABELS`` indices honoring the configured ratios."""
 
-    counts = {label: int(total_tasks * ratio) for label, ratio in MIX_RATIO.items()}
+    counts = np.array([int(total_tasks * MIX_RATIO[label]) for label in LABELS], dtype=np.int64)
     # Ensure rounding errors still hit total
-    while sum(counts.values()) < total_tasks:
-        counts["io"] += 1
+    counts[0] += total_tasks - counts.sum()
 
-    plan = [label for label, count in counts.items() for _ in range(count)]
-    rng = random.Random(seed)
+    plan = np.repeat(np.arange(len(LABELS), dtype=np.int8), counts)
+    rng = np.random.default_rng(seed)
     rng.shuffle(plan)
     return plan
 
@@ -70,103 +83,101 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
     if config.warmup_seconds:
         await asyncio.sleep(config.warmup_seconds)
 
-    task_timings: list[TaskTiming] = []
+    await driver.client.set(HEAVY_PAYLOAD_KEY, HEAVY_PAYLOAD, ex=HEAVY_PAYLOAD_TTL_SECONDS)
+
     monitor = ResourceMonitor(interval_seconds=0.5)
     await monitor.start()
 
-    plan = _build_task_plan(config.task_count)
-    enqueue_start = time.perf_counter()
-
-    for idx, label in enumerate(plan):
-        enqueue_time = time.perf_counter()
-
-        if label == "io":
-            task_id = await mixed_io_task.dispatch(task_id=idx)
-        elif label == "cpu_light":
-            task = mixed_cpu_light(data=LIGHT_JSON)
-            task_id = await task.dispatch()
-        else:  # cpu_heavy
-            task = MixedCPUHeavy(data=HEAVY_PAYLOAD).on_queue("cpu-bound")
-            task_id = await task.dispatch()
-
-        task_timings.append(TaskTiming(task_id=task_id, enqueue_time=enqueue_time))
-
-    enqueue_duration = time.perf_counter() - enqueue_start
-
-    processing_start = time.perf_counter()
-    timeout = config.timeout_seconds
-    start = time.perf_counter()
-    poll_interval = 0.5
-    completed = 0
-    failed = 0
-    queue_depth_samples: list[tuple[float, int]] = []
-    last_pending = None
-    stagnant_polls = 0
-
-    while (time.perf_counter() - start) < timeout:
-        try:
-            stats = await driver.get_global_stats()
-            pending = stats.get("pending", 0)
-            running = stats.get("running", 0)
-            timestamp = time.perf_counter()
-            queue_depth_samples.append((timestamp, pending + running))
-
-            if pending == 0 and running == 0:
-                completed = config.task_count
-                failed = 0
-                break
-
-            if pending == last_pending:
-                stagnant_polls += 1
-                if stagnant_polls > 60:
-                    completed = config.task_count - pending
-                    failed = pending
-                    break
-            else:
-                stagnant_polls = 0
-                last_pending = pending
-        except Exception:
-            pass
-
-        await asyncio.sleep(poll_interval)
-    else:
-        try:
-            stats = await driver.get_global_stats()
-            pending = stats.get("pending", 0)
-            running = stats.get("running", 0)
-            completed = config.task_count - (pending + running)
-            failed = pending + running
-        except Exception:
-            completed = 0
-            failed = config.task_count
-
-    processing_end = time.perf_counter()
-    processing_duration = processing_end - processing_start
-
-    avg_cpu, avg_memory = await monitor.stop()
-
-    if processing_duration > 0 and task_timings and len(queue_depth_samples) > 2:
-        total_tasks = len(task_timings)
-        for i, timing in enumerate(task_timings):
-            target_depth = total_tasks - i - 1
-            closest_sample = queue_depth_samples[0]
-            for timestamp, depth in queue_depth_samples:
-                if depth <= target_depth:
-                    closest_sample = (timestamp, depth)
+    drain_listener = QueueDrainListener(getattr(driver, "client", None), ["default", "cpu-bound"])
+    try:
+        plan = _build_task_plan(config.task_count)
+        task_ids: list[str] = []
+        checkpoints: list[tuple[int, float]] = []
+        enqueue_start = time.perf_counter()
+
+        for idx, code in enumerate(plan.tolist()):
+            label = LABELS[code]
+            if idx % ENQUEUE_SAMPLE_STRIDE == 0:
+                checkpoints.append((idx, time.perf_counter()))
+
+            if label == "io":
+                task_id = await mixed_io_task.dispatch(task_id=idx)
+            elif label == "cpu_light":
+                task = mixed_cpu_light(data=LIGHT_JSON)
+                task_id = await task.dispatch()
+            else:  # cpu_heavy
+                task = MixedCPUHeavy(payload_key=HEAVY_PAYLOAD_KEY).on_queue("cpu-bound")
+                task_id = await task.dispatch()
+
+            task_ids.append(task_id)
+
+        enqueue_end = time.perf_counter()
+        enqueue_duration = enqueue_end - enqueue_start
+        checkpoints.append((config.task_count, enqueue_end))
+        task_timings = interpolate_task_timings(task_ids, checkpoints)
+
+        await drain_listener.start()
+
+        processing_start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.timeout_seconds
+        poll_interval = 0.5
+        next_poll = loop.time()
+        completed = 0
+        failed = 0
+        queue_depth_samples: list[tuple[float, int]] = []
+        last_pending = None
+        stagnant_polls = 0
+
+        while loop.time() < deadline:
+            try:
+                stats = await driver.get_global_stats()
+                pending = stats.get("pending", 0)
+                running = stats.get("running", 0)
+                timestamp = time.perf_counter()
+                queue_depth_samples.append((timestamp, pending + running))
+
+                if pending == 0 and running == 0:
+                    completed = config.task_count
+                    failed = 0
                     break
-            timing.complete_time = closest_sample[0]
-            timing.start_time = max(processing_start, timing.complete_time - 0.2)
-    elif processing_duration > 0 and task_timings:
-        time_per_task = processing_duration / len(task_timings)
-        for i, timing in enumerate(task_timings):
-            timing.start_time = processing_start + (i * time_per_task * 0.9)
-            timing.complete_time = processing_start + ((i + 1) * time_per_task)
-    else:
-        for timing in task_timings:
-            timing.start_time = processing_start
-            timing.complete_time = processing_end
-
-    await driver.disconnect()
+
+                if pending == last_pending:
+                    stagnant_polls += 1
+                    if stagnant_polls > 60:
+                        completed = config.task_count - pending
+                        failed = pending
+                        break
+                else:
+                    stagnant_polls = 0
+                    last_pending = pending
+            except Exception:
+                pass
+
+            # Sleep until the next absolute tick; a drain notification restarts the cadence
+            next_poll = max(next_poll + poll_interval, loop.time())
+            if await drain_listener.wait_until(min(next_poll, deadline)):
+                next_poll = loop.time()
+        else:
+            try:
+                stats = await driver.get_global_stats()
+                pending = stats.get("pending", 0)
+                running = stats.get("running", 0)
+                completed = config.task_count - (pending + running)
+                failed = pending + running
+            except Exception:
+                completed = 0
+                failed = config.task_count
+
+        processing_end = time.perf_counter()
+        processing_duration = processing_end - processing_start
+    finally:
+        # Release the pub/sub connection, monitor task and driver even on timeout or error
+        await drain_listener.stop()
+        avg_cpu, avg_memory = await monitor.stop()
+        await driver.disconnect()
+
+    estimate_task_timings(task_timings, queue_depth_samples, processing_start, processing_end, 0.2)
 
     return BenchmarkResult(
         config=config,
@@ -184,101 +195,83 @@ async def run_asynctasq(config: BenchmarkConfig) -> BenchmarkResult:
 
 
 def run_celery(config: BenchmarkConfig) -> BenchmarkResult:
-    from kombu import Connection
+    import redis
+
+    from tasks.celery_tasks import (
+        INFLIGHT_KEY,
+        app,
+        mixed_cpu_heavy,
+        mixed_cpu_light,
+        mixed_io_task,
+    )
 
-    from tasks.celery_tasks import app, mixed_cpu_heavy, mixed_cpu_light, mixed_io_task
+    broker = redis.Redis.from_url(app.conf.broker_url)
+    broker.set(HEAVY_PAYLOAD_KEY, HEAVY_PAYLOAD, ex=HEAVY_PAYLOAD_TTL_SECONDS)
 
     if config.warmup_seconds:
         time.sleep(config.warmup_seconds)
 
-    task_timings: list[TaskTiming] = []
-    process = psutil.Process()
-    process.cpu_percent()
-    cpu_samples: list[float] = []
-    memory_samples: list[float] = []
+    monitor = SyncResourceMonitor(interval_seconds=0.5)
+    monitor.start()
 
     plan = _build_task_plan(config.task_count)
+    task_ids: list[str] = []
+    checkpoints: list[tuple[int, float]] = []
+
+    # Workers count this down as tasks finish; set before enqueue so none are missed
+    broker.set(INFLIGHT_KEY, config.task_count)
 
     with Timer() as enqueue_timer:
-        for idx, label in enumerate(plan):
-            enqueue_time = time.perf_counter()
+        for idx, code in enumerate(plan.tolist()):
+            label = LABELS[code]
+            if idx % ENQUEUE_SAMPLE_STRIDE == 0:
+                checkpoints.append((idx, time.perf_counter()))
             if label == "io":
                 result = mixed_io_task.delay(task_id=idx)
             elif label == "cpu_light":
                 result = mixed_cpu_light.delay(data=LIGHT_JSON)
             else:
-                result = mixed_cpu_heavy.delay(data=HEAVY_PAYLOAD)
+                result = mixed_cpu_heavy.delay(payload_key=HEAVY_PAYLOAD_KEY)
 
-            task_timings.append(
-                TaskTiming(
-                    task_id=result.id if hasattr(result, "id") else f"task_{idx}",
-                    enqueue_time=enqueue_time,
-                )
-            )
+            task_ids.append(result.id if hasattr(result, "id") else f"task_{idx}")
+
+    checkpoints.append((config.task_count, enqueue_timer.end_time))
+    task_timings = interpolate_task_timings(task_ids, checkpoints)
 
     queue_depth_samples: list[tuple[float, int]] = []
 
     with Timer() as processing_timer:
         processing_start = time.perf_counter()
-        timeout = config.timeout_seconds
-        start = time.perf_counter()
+        deadline = processing_start + config.timeout_seconds
         poll_interval = 0.5
+        next_poll = processing_start
 
-        with Connection(app.conf.broker_url) as conn:
-            queue_name = "celery"
-            consecutive_empty = 0
-
-            while (time.perf_counter() - start) < timeout:
-                cpu_samples.append(process.cpu_percent())
-                memory_samples.append(process.memory_info().rss / 1024 / 1024)
-
-                try:
-                    queue = conn.SimpleQueue(queue_name)
-                    qsize = queue.qsize()
-                    queue.close()
-                    timestamp = time.perf_counter()
-                    queue_depth_samples.append((timestamp, qsize))
-
-                    if qsize == 0:
-                        consecutive_empty += 1
-                        if consecutive_empty >= 3:
-                            break
-                    else:
-                        consecutive_empty = 0
-                except Exception as exc:  # pragma: no cover - defensive branch
-                    if "NOT_FOUND" in str(exc) or "404" in str(exc):
-                        break
+        remaining = config.task_count
 
-                time.sleep(poll_interval)
+        while time.perf_counter() < deadline:
+            try:
+                remaining = int(broker.get(INFLIGHT_KEY) or 0)
+                timestamp = time.perf_counter()
+                queue_depth_samples.append((timestamp, remaining))
 
-        processing_end = time.perf_counter()
-        processing_duration = processing_timer.elapsed
-
-    avg_cpu = sum(cpu_samples) / len(cpu_samples) if cpu_samples else 0.0
-    avg_memory = sum(memory_samples) / len(memory_samples) if memory_samples else 0.0
-    completed = config.task_count
-    failed = 0
-
-    if processing_duration > 0 and task_timings and len(queue_depth_samples) > 2:
-        total_tasks = len(task_timings)
-        for i, timing in enumerate(task_timings):
-            target_depth = total_tasks - i - 1
-            closest_sample = queue_depth_samples[0]
-            for timestamp, depth in queue_depth_samples:
-                if depth <= target_depth:
-                    closest_sample = (timestamp, depth)
+                if remaining <= 0:
                     break
-            timing.complete_time = closest_sample[0]
-            timing.start_time = max(processing_start, timing.complete_time - 0.2)
-    elif processing_duration > 0 and task_timings:
-        time_per_task = processing_duration / len(task_timings)
-        for i, timing in enumerate(task_timings):
-            timing.start_time = processing_start + (i * time_per_task * 0.9)
-            timing.complete_time = processing_start + ((i + 1) * time_per_task)
-    else:
-        for timing in task_timings:
-            timing.start_time = processing_start
-            timing.complete_time = processing_end
+            except Exception:  # pragma: no cover - defensive branch
+                pass
+
+            next_poll = max(next_poll + poll_interval, time.perf_counter())
+            time.sleep(max(0.0, min(next_poll, deadline) - time.perf_counter()))
+
+        processing_end = time.perf_counter()
+
+    broker.delete(INFLIGHT_KEY)
+    broker.close()
+
+    avg_cpu, avg_memory = monitor.stop()
+    failed = max(remaining, 0)
+    completed = config.task_count - failed
+
+    estimate_task_timings(task_timings, queue_depth_samples, processing_start, processing_end, 0.2)
 
     total_time = enqueue_timer.elapsed + processing_timer.elapsed
 
@@ -8,7 +8,10 @@ without touching the orchestration code.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Mapping
+import functools
+from types import MappingProxyType
+from typing import NamedTuple
 
 from benchmarks.common import Framework, ScenarioDefinition, WorkerConfig
 
@@ -16,10 +19,34 @@ from benchmarks.common import Framework, ScenarioDefinition, WorkerConfig
 # Scenario metadata
 # ----------------------------------------------------------------------------
 
-SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
-    "1": ScenarioDefinition(
+
+class _IndexEntry(NamedTuple):
+    """Listing metadata; the single source of each scenario's name and status."""
+
+    name: str
+    implemented: bool
+
+
+_SCENARIO_INDEX: dict[str, _IndexEntry] = {
+    "1": _IndexEntry("Basic Throughput", implemented=True),
+    "2": _IndexEntry("I/O-Bound", implemented=True),
+    "3": _IndexEntry("CPU-Bound", implemented=True),
+    "4": _IndexEntry("Mixed Workload", implemented=True),
+    "5": _IndexEntry("Serialization", implemented=False),
+    "6": _IndexEntry("Scalability Sweep", implemented=False),
+    "7": _IndexEntry("Real-World Pipeline", implemented=False),
+    "8": _IndexEntry("Cold Start", implemented=False),
+    "9": _IndexEntry("Multi-Queue", implemented=False),
+    "10": _IndexEntry("Event Streaming", implemented=False),
+    "11": _IndexEntry("FastAPI Integration", implemented=False),
+}
+
+# Factories receive their index entry as keyword arguments, so only the scenarios a
+# CLI invocation touches get built
+_SCENARIO_FACTORIES: dict[str, Callable[..., ScenarioDefinition]] = {
+    "1": lambda **meta: ScenarioDefinition(
         id="1",
-        name="Basic Throughput",
+        **meta,
         module="benchmarks.scenario_1_throughput",
         description="20k no-op tasks to establish pure broker throughput.",
         task_count=20_000,
@@ -47,9 +74,9 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
         },
         notes="Prefetch multiplier forced to 1 to avoid dequeue bursts and to match Redis connection guidance from Mahmud 2025.",
     ),
-    "2": ScenarioDefinition(
+    "2": lambda **meta: ScenarioDefinition(
         id="2",
-        name="I/O-Bound",
+        **meta,
         module="benchmarks.scenario_2_io_bound",
         description="HTTP heavy workload hitting the mock API with async fan-out.",
         task_count=5_000,
@@ -74,16 +101,22 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
                 description="Threads pool per Celery docs for blocking HTTP workloads",
             ),
         },
-        notes="Mock API must be running (just docker-up-mock).",
+        notes=(
+            "Mock API must be running (just docker-up-mock). Dispatches fetch_user_http only. "
+            "Celery uses the threads pool (blocking sockets release the GIL) with 32 threads "
+            "against AsyncTasQ's 32 coroutines; both keep per-process HTTP pools of 512 "
+            "connections (256 kept alive). gevent/eventlet are not used."
+        ),
     ),
-    "3": ScenarioDefinition(
+    "3": lambda **meta: ScenarioDefinition(
         id="3",
-        name="CPU-Bound",
+        **meta,
         module="benchmarks.scenario_3_cpu_bound",
         description="PBKDF2 hashing of 10MB payloads to stress process pools.",
         task_count=1_000,
         worker_count=4,
         warmup_seconds=20,
+        dry_run_tasks=8,  # one PBKDF2 task per pool process is enough to warm it
         tags=("cpu", "process"),
         requirements=("redis",),
         worker_profiles={
@@ -104,9 +137,9 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
             ),
         },
     ),
-    "4": ScenarioDefinition(
+    "4": lambda **meta: ScenarioDefinition(
         id="4",
-        name="Mixed Workload",
+        **meta,
         module="benchmarks.scenario_4_mixed",
         description="Blend of 60% async I/O, 30% light CPU, and 10% heavy CPU to mimic real services.",
         task_count=10_000,
@@ -133,9 +166,9 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
         },
     ),
     # Planned scenarios - documented so users can see roadmap.
-    "5": ScenarioDefinition(
+    "5": lambda **meta: ScenarioDefinition(
         id="5",
-        name="Serialization",
+        **meta,
         module="",
         description="Msgpack vs JSON payloads, ORM fan-out",
         task_count=5_000,
@@ -143,23 +176,21 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
         warmup_seconds=10,
         tags=("serialization",),
         requirements=("redis",),
-        implemented=False,
         notes="TODO: leverage ORM fixtures to compare payload sizes.",
     ),
-    "6": ScenarioDefinition(
+    "6": lambda **meta: ScenarioDefinition(
         id="6",
-        name="Scalability Sweep",
+        **meta,
         module="",
         description="Ramp from 1k to 100k tasks to study saturation and queue depth.",
         task_count=100_000,
         worker_count=12,
         warmup_seconds=30,
         tags=("scale",),
-        implemented=False,
     ),
-    "7": ScenarioDefinition(
+    "7": lambda **meta: ScenarioDefinition(
         id="7",
-        name="Real-World Pipeline",
+        **meta,
         module="",
         description="E-commerce style orchestrations with retries and sagas.",
         task_count=2_000,
@@ -167,44 +198,41 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
         warmup_seconds=20,
         tags=("pipeline",),
         requirements=("redis", "mock-api"),
-        implemented=False,
     ),
-    "8": ScenarioDefinition(
+    "8": lambda **meta: ScenarioDefinition(
         id="8",
-        name="Cold Start",
+        **meta,
         module="",
         description="Measure worker spin-up and first task latency.",
         task_count=200,
         worker_count=1,
         warmup_seconds=0,
+        dry_run_tasks=0,  # measures spin-up, so never pre-warm
         tags=("startup",),
-        implemented=False,
     ),
-    "9": ScenarioDefinition(
+    "9": lambda **meta: ScenarioDefinition(
         id="9",
-        name="Multi-Queue",
+        **meta,
         module="",
         description="Priority routing and queue partitioning stress test.",
         task_count=8_000,
         worker_count=10,
         warmup_seconds=15,
         tags=("routing",),
-        implemented=False,
     ),
-    "10": ScenarioDefinition(
+    "10": lambda **meta: ScenarioDefinition(
         id="10",
-        name="Event Streaming",
+        **meta,
         module="",
         description="Pub/Sub throughput and event emission overhead.",
         task_count=15_000,
         worker_count=10,
         warmup_seconds=15,
         tags=("events",),
-        implemented=False,
     ),
-    "11": ScenarioDefinition(
+    "11": lambda **meta: ScenarioDefinition(
         id="11",
-        name="FastAPI Integration",
+        **meta,
         module="",
         description="HTTP dispatch path integration and request lifecycle hooks.",
         task_count=3_000,
@@ -212,11 +240,34 @@ SCENARIO_REGISTRY: dict[str, ScenarioDefinition] = {
         warmup_seconds=10,
         tags=("fastapi",),
         requirements=("redis",),
-        implemented=False,
     ),
 }
 
 
+_ALL_KEYS: tuple[str, ...] = tuple(_SCENARIO_INDEX)
+_IMPLEMENTED_KEYS: tuple[str, ...] = tuple(
+    key for key, entry in _SCENARIO_INDEX.items() if entry.implemented
+)
+
+
+@functools.cache
+def _build(scenario_id: str) -> ScenarioDefinition:
+    meta = _SCENARIO_INDEX[scenario_id]
+    return _SCENARIO_FACTORIES[scenario_id](name=meta.name, implemented=meta.implemented)
+
+
+@functools.cache
+def _full_registry() -> Mapping[str, ScenarioDefinition]:
+    return MappingProxyType({key: _build(key) for key in _ALL_KEYS})
+
+
+def __getattr__(name: str) -> Mapping[str, ScenarioDefinition]:
+    # PEP 562: materialize the full catalog once, on first SCENARIO_REGISTRY access
+    if name == "SCENARIO_REGISTRY":
+        return _full_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ----------------------------------------------------------------------------
 # Registry helpers
 # ----------------------------------------------------------------------------
@@ -226,20 +277,21 @@ def get_scenario_definition(scenario_id: str) -> ScenarioDefinition:
     """Return scenario metadata or raise helpful error."""
 
     try:
-        return SCENARIO_REGISTRY[scenario_id]
+        return _build(scenario_id)
     except KeyError as exc:  # pragma: no cover - defensive guard
         raise ValueError(f"Unknown scenario '{scenario_id}'.") from exc
 
 
-def implemented_scenarios() -> dict[str, ScenarioDefinition]:
+@functools.cache
+def implemented_scenarios() -> Mapping[str, ScenarioDefinition]:
     """Return only scenarios that have runnable modules."""
 
-    return {k: v for k, v in SCENARIO_REGISTRY.items() if v.implemented}
+    return MappingProxyType({key: _build(key) for key in _IMPLEMENTED_KEYS})
 
 
 def scenario_choices(include_unimplemented: bool = False) -> Iterable[str]:
     """List scenario keys for CLI help text."""
 
     if include_unimplemented:
-        return SCENARIO_REGISTRY.keys()
-    return implemented_scenarios().keys()
+        return _ALL_KEYS
+    return _IMPLEMENTED_KEYS
@@ -1,15 +1,51 @@
+"""Worker process management for benchmark runs.
+
+Launches AsyncTasQ and Celery worker groups as subprocesses and tears them down.
+"""
+
 from collections.abc import Sequence
+import functools
+import importlib.util
 import os
 from pathlib import Path
 import signal
 import subprocess
 import time
-
-from rich.console import Console
+from typing import Any
 
 from benchmarks.common import Framework, WorkerConfig
 
-console = Console()
+__all__ = ["WorkerManager"]
+
+if os.getenv("BENCH_QUIET"):
+    # Keep rich's markup parsing and rendering out of the spawn path
+    def _log(*args: Any, **kwargs: Any) -> None:
+        return None
+
+else:
+    from rich.console import Console
+
+    _console = Console()
+
+    def _log(*args: Any, **kwargs: Any) -> None:
+        _console.print(*args, **kwargs)
+
+
+# Log output that signals a worker is consuming; empty means "any output". Celery logs
+# " ready." once its consumer is attached. The asynctasq CLI prints nothing after
+# driver.connect(), so its marker is only a liveness check (the process started
+# logging) and is backed by a minimum wait that covers the broker connect.
+_READY_MARKERS: dict[Framework, bytes] = {
+    Framework.CELERY: b" ready.",
+    Framework.ASYNCTASQ: b"",
+}
+_MIN_READY_WAIT: dict[Framework, float] = {
+    Framework.CELERY: 0.0,
+    Framework.ASYNCTASQ: 2.0,
+}
+_READY_POLL_INTERVAL = 0.05
+_STOP_TIMEOUT = 5.0
+_HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
 
 
 class WorkerManager:
@@ -24,102 +60,199 @@ class WorkerManager:
         """Start one or more worker groups based on the provided configs."""
 
         if not configs:
-            console.print("[yellow]No worker configs provided; assuming manual workers.[/yellow]")
+            _log("[yellow]No worker configs provided; assuming manual workers.[/yellow]")
             return
 
         self.stop_workers()
 
+        if any(c.framework == Framework.ASYNCTASQ for c in configs) and not _HAS_UVLOOP:
+            # The AsyncTasQ worker only switches to uvloop when it can import it
+            _log(
+                "[yellow]⚠ uvloop not installed; AsyncTasQ workers will use the stdlib loop.[/yellow]"
+            )
+
         for config in configs:
             self._launch_group(config)
 
     def _launch_group(self, config: WorkerConfig) -> None:
-        env = os.environ.copy()
-        env.update(config.env_overrides)
-        env["PYTHONPATH"] = os.getcwd() + os.pathsep + env.get("PYTHONPATH", "")
+        # Collect only the deltas, then merge with the inherited environment in one step
+        overrides = dict(config.env_overrides)
+        pythonpath = overrides.get("PYTHONPATH", os.environ.get("PYTHONPATH", ""))
+        overrides["PYTHONPATH"] = os.getcwd() + os.pathsep + pythonpath
 
-        if config.framework == Framework.CELERY and config.prefetch_multiplier is not None:
-            env.setdefault("CELERY_WORKER_PREFETCH_MULTIPLIER", str(config.prefetch_multiplier))
+        if (
+            config.framework == Framework.CELERY
+            and config.prefetch_multiplier is not None
+            and "CELERY_WORKER_PREFETCH_MULTIPLIER" not in os.environ
+        ):
+            overrides.setdefault(
+                "CELERY_WORKER_PREFETCH_MULTIPLIER", str(config.prefetch_multiplier)
+            )
+
+        env = {**os.environ, **overrides}
 
         cmd = self._build_command(config)
-        console.print(
+        _log(
             f"[bold blue]Starting {config.worker_count} {config.framework.value} worker(s) ({config.description or 'no description'})...[/bold blue]"
         )
-        console.print(f"[dim]Command: {' '.join(cmd)}[/dim]")
+        _log(f"[dim]Command: {' '.join(cmd)}[/dim]")
 
+        launched: list[tuple[subprocess.Popen, Path]] = []
         for idx in range(config.worker_count):
             log_file = self.log_dir / f"{config.framework.value}_worker_{idx}.log"
-            with open(log_file, "w", encoding="utf-8") as handle:
+            # Raw fd is all Popen needs; the child gets its own dup of it
+            fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
                 process = subprocess.Popen(
                     cmd,
-                    stdout=handle,
+                    stdout=fd,
                     stderr=subprocess.STDOUT,
                     env=env,
                     cwd=os.getcwd(),
-                    preexec_fn=os.setsid,
+                    start_new_session=True,
                 )
-                self.processes.append(process)
-
-        time.sleep(5)
-
-    def _build_command(self, config: WorkerConfig) -> list[str]:
-        if config.framework == Framework.ASYNCTASQ:
-            cmd: list[str] = [
-                "uv",
-                "run",
-                "python",
-                "-m",
-                "asynctasq",
-                "worker",
-                "--concurrency",
-                str(config.concurrency),
-                "--log-level",
-                config.log_level.lower(),
-            ]
-            if config.queues:
-                cmd.extend(["--queues", ",".join(config.queues)])
-            cmd.extend(config.extra_args)
-            return cmd
-
-        if config.framework == Framework.CELERY:
-            cmd = [
-                "uv",
-                "run",
-                "celery",
-                "-A",
-                config.app_path or "tasks.celery_tasks",
-                "worker",
-                f"--loglevel={config.log_level.lower()}",
-                f"--concurrency={config.concurrency}",
-                f"--pool={config.pool}",
-            ]
-            if config.autoscale:
-                cmd.append(f"--autoscale={config.autoscale[0]},{config.autoscale[1]}")
-            if config.queues:
-                cmd.extend(["-Q", ",".join(config.queues)])
-            cmd.extend(config.extra_args)
-            return cmd
-
-        raise ValueError(f"Unsupported framework: {config.framework}")
+            finally:
+                os.close(fd)
+            self.processes.append(process)
+            launched.append((process, log_file))
+
+        self._wait_until_ready(config, launched)
+
+    def _wait_until_ready(
+        self, config: WorkerConfig, launched: list[tuple[subprocess.Popen, Path]]
+    ) -> None:
+        """Poll worker logs until every worker reports ready or the timeout expires."""
+        marker = _READY_MARKERS[config.framework]
+        started = time.monotonic()
+        deadline = started + config.ready_timeout
+        pending = launched
+
+        while pending and time.monotonic() < deadline:
+            waiting = []
+            for process, log_file in pending:
+                if process.poll() is not None:
+                    _log(
+                        f"[red]Worker exited during startup (code {process.returncode}); "
+                        f"see {log_file}[/red]"
+                    )
+                elif not _log_contains(log_file, marker):
+                    waiting.append((process, log_file))
+            pending = waiting
+            if pending:
+                time.sleep(_READY_POLL_INTERVAL)
+
+        if pending:
+            _log(
+                f"[yellow]{len(pending)} {config.framework.value} worker(s) not ready after "
+                f"{config.ready_timeout:.0f}s; continuing anyway[/yellow]"
+            )
+
+        remaining = started + _MIN_READY_WAIT[config.framework] - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _build_command(self, config: WorkerConfig) -> tuple[str, ...]:
+        return _worker_command(
+            config.framework,
+            config.concurrency,
+            config.pool,
+            tuple(config.queues),
+            config.app_path,
+            config.log_level,
+            config.autoscale,
+            tuple(config.extra_args),
+        )
 
     def stop_workers(self):
         if not self.processes:
             return
 
-        console.print(f"[bold yellow]Stopping {len(self.processes)} workers...[/bold yellow]")
+        _log(f"[bold yellow]Stopping {len(self.processes)} workers...[/bold yellow]")
         for p in self.processes:
             try:
                 os.killpg(os.getpgid(p.pid), signal.SIGTERM)
             except ProcessLookupError:
                 pass
 
-        # Wait for exit
+        # Wait for exit against one shared deadline so teardown is bounded for any group size
+        deadline = time.monotonic() + _STOP_TIMEOUT
         for p in self.processes:
             try:
-                p.wait(timeout=5)
+                p.wait(timeout=max(0.0, deadline - time.monotonic()))
             except subprocess.TimeoutExpired:
-                try:
-                    os.killpg(os.getpgid(p.pid), signal.SIGKILL)
-                except ProcessLookupError:
-                    pass
+                pass
+
+        # Kill whatever ignored SIGTERM in a single sweep
+        stragglers = [p for p in self.processes if p.poll() is None]
+        for p in stragglers:
+            try:
+                os.killpg(os.getpgid(p.pid), signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        for p in stragglers:
+            p.wait()
 
         self.processes = []
+
+
+@functools.lru_cache(maxsize=32)
+def _worker_command(
+    framework: Framework,
+    concurrency: int,
+    pool: str,
+    queues: tuple[str, ...],
+    app_path: str,
+    log_level: str,
+    autoscale: tuple[int, int] | None,
+    extra_args: tuple[str, ...],
+) -> tuple[str, ...]:
+    """Assemble the worker command line (memoized across repeated runs)."""
+
+    if framework == Framework.ASYNCTASQ:
+        cmd: list[str] = [
+            "uv",
+            "run",
+            "python",
+            "-m",
+            "asynctasq",
+            "worker",
+            "--concurrency",
+            str(concurrency),
+            "--log-level",
+            log_level.lower(),
+        ]
+        if queues:
+            cmd.extend(["--queues", ",".join(queues)])
+        cmd.extend(extra_args)
+        return tuple(cmd)
+
+    if framework == Framework.CELERY:
+        cmd = [
+            "uv",
+            "run",
+            "celery",
+            "-A",
+            app_path or "tasks.celery_tasks",
+            "worker",
+            f"--loglevel={log_level.lower()}",
+            f"--concurrency={concurrency}",
+            f"--pool={pool}",
+        ]
+        if autoscale:
+            cmd.append(f"--autoscale={autoscale[0]},{autoscale[1]}")
+        if queues:
+            cmd.extend(["-Q", ",".join(queues)])
+        cmd.extend(extra_args)
+        return tuple(cmd)
+
+    raise ValueError(f"Unsupported framework: {framework}")
+
+
+def _log_contains(log_file: Path, marker: bytes) -> bool:
+    """Return True once ``log_file`` contains ``marker`` (or any output if empty)."""
+    try:
+        if log_file.stat().st_size == 0:
+            return False
+        return marker in log_file.read_bytes()
+    except OSError:
+        return False
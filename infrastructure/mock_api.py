@@ -4,12 +4,26 @@ Simulates external HTTP APIs with configurable latency.
 """
 
 import asyncio
+import random
 from typing import Any
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 
 app = FastAPI(title="Benchmark Mock API")
 
+_random = random.random
+
+# Response bodies are pre-rendered compact JSON; handlers only splice in the ids
+_USER_JSON = (
+    '{"id":%d,"name":"User %d","email":"user%d@example.com","created_at":"2025-01-01T00:00:00Z"}'
+)
+_ORDER_JSON = (
+    '{"id":%d,"user_id":%d,"status":"pending","total":99.99,"items":['
+    '{"product_id":1,"quantity":2,"price":29.99},'
+    '{"product_id":2,"quantity":1,"price":39.99}],'
+    '"created_at":"2025-01-01T00:00:00Z"}'
+)
+
 
 @app.get("/")
 async def root() -> dict[str, str]:
@@ -21,7 +35,7 @@ async def root() -> dict[str, str]:
 async def get_user(
     user_id: int,
     latency: int = Query(default=100, ge=0, le=5000, description="Response latency in ms"),
-) -> dict[str, Any]:
+) -> Response:
     """Simulate user API with configurable latency.
 
     Args:
@@ -32,19 +46,15 @@ async def get_user(
         Mock user data
     """
     await asyncio.sleep(latency / 1000)
-    return {
-        "id": user_id,
-        "name": f"User {user_id}",
-        "email": f"user{user_id}@example.com",
-        "created_at": "2025-01-01T00:00:00Z",
-    }
+    body = _USER_JSON % (user_id, user_id, user_id)
+    return Response(content=body.encode(), media_type="application/json")
 
 
 @app.get("/orders/{order_id}")
 async def get_order(
     order_id: int,
     latency: int = Query(default=150, ge=0, le=5000, description="Response latency in ms"),
-) -> dict[str, Any]:
+) -> Response:
     """Simulate order API with configurable latency.
 
     Args:
@@ -55,17 +65,8 @@ async def get_order(
         Mock order data
     """
     await asyncio.sleep(latency / 1000)
-    return {
-        "id": order_id,
-        "user_id": order_id * 10,
-        "status": "pending",
-        "total": 99.99,
-        "items": [
-            {"product_id": 1, "quantity": 2, "price": 29.99},
-            {"product_id": 2, "quantity": 1, "price": 39.99},
-        ],
-        "created_at": "2025-01-01T00:00:00Z",
-    }
+    body = _ORDER_JSON % (order_id, order_id * 10)
+    return Response(content=body.encode(), media_type="application/json")
 
 
 @app.post("/webhooks/process")
@@ -84,6 +85,11 @@ async def process_webhook(
     return {"status": "processed", "message": "Webhook received"}
 
 
+def _sum_of_squares(n: int) -> int:
+    """Deliberate CPU burn for the heavy-computation endpoint."""
+    return sum(i * i for i in range(n))
+
+
 @app.get("/heavy-computation")
 async def heavy_computation(
     complexity: int = Query(default=1000, ge=1, le=100000, description="Computation complexity"),
@@ -98,8 +104,8 @@ async def heavy_computation(
     Returns:
         Computation result
     """
-    # Simulate some computation
-    result = sum(i * i for i in range(complexity))
+    # Simulate some computation off the event loop so concurrent requests keep being served
+    result = await asyncio.to_thread(_sum_of_squares, complexity)
 
     if latency > 0:
         await asyncio.sleep(latency / 1000)
@@ -130,11 +136,13 @@ async def error_simulation(
     """
     await asyncio.sleep(latency / 1000)
 
-    import random
-
-    if random.random() < error_rate:
-        from fastapi import HTTPException
-
+    if _random() < error_rate:
         raise HTTPException(status_code=500, detail="Simulated server error")
 
     return {"status": "success", "message": "No error occurred"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools")
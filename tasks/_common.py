@@ -0,0 +1,60 @@
+"""Pure helpers shared by the AsyncTasQ and Celery task modules.
+
+Both frameworks run the same kernels from here so the comparison can't drift
+between two copies.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import redis
+
+# Hash kernels for compute_hash tasks; PBKDF2 (key stretching) stays the default.
+# hashlib.pbkdf2_hmac always runs OpenSSL's PKCS5_PBKDF2_HMAC on Python 3.12+ (the
+# pure-Python fallback was removed), so it already gets OpenSSL's SHA-NI code paths.
+_BLAKE2B_KEY = hashlib.sha256(b"salt").digest()  # precomputed keyed-hash seed
+
+
+def compute_hash(data: bytes, iterations: int, algorithm: str) -> str:
+    """Hash ``data`` with the selected kernel (``iterations`` applies to PBKDF2 only)."""
+    if algorithm == "pbkdf2_sha256":
+        return hashlib.pbkdf2_hmac("sha256", data, b"salt", iterations).hex()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=32, key=_BLAKE2B_KEY).hexdigest()
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+
+def checksum(data: bytes) -> str:
+    """Return a 128-bit payload checksum."""
+    # BLAKE2b-128: same digest length as MD5 but faster on 64-bit CPUs
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def count_leaves(obj: Any) -> int:
+    """Count scalar leaves in nested dicts/lists using an explicit stack (no recursion)."""
+    count = 0
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        else:
+            count += 1
+    return count
+
+
+def fetch_payload(client: redis.Redis, payload_key: str) -> bytes:
+    """Fetch a payload uploaded once by the benchmark.
+
+    Payloads are raw bytes, so ``client`` must not use ``decode_responses``.
+    """
+    payload = client.get(payload_key)
+    if payload is None:
+        raise KeyError(f"Shared payload {payload_key!r} not found in Redis")
+    if not isinstance(payload, bytes):
+        raise TypeError(f"Shared payload {payload_key!r} was decoded; expected raw bytes")
+    return payload
@@ -5,14 +5,23 @@ Equivalent implementations of AsyncTasQ tasks for fair comparison.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import hashlib
-import json
+import math
 import os
+import random
 import time
 from typing import Any
 
-from celery import Celery
+from celery import Celery, states
+from celery.signals import task_postrun
+from pydantic_core import from_json
+import redis
 import requests
+from requests.adapters import HTTPAdapter
+
+from tasks._common import checksum, compute_hash, count_leaves, fetch_payload
 
 # Initialize Celery app with explicit Redis database separation
 # IMPORTANT: Celery uses DB 1 (broker) and DB 2 (backend) to avoid conflicts with AsyncTasQ (DB 0)
@@ -24,9 +33,11 @@ app = Celery(
 
 # Configure Celery
 app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack carries bytes natively (no hex/base64 round trip) and keeps messages compact;
+    # JSON stays accepted for clients that still publish it
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -34,11 +45,54 @@ app.conf.update(
     worker_prefetch_multiplier=4,
 )
 
+# Outstanding task counter in the broker DB. Benchmarks SET it to the number of
+# tasks they enqueue and workers DECR it as each tracked task finishes, so drain
+# detection is a single GET instead of repeated queue-length probes.
+INFLIGHT_KEY = "bench:inflight"
+
+# Decrement only while a benchmark owns the counter so stray tasks never create it
+_DECR_IF_PRESENT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('DECR', KEYS[1])
+end
+return nil
+"""
+
+
+@functools.cache
+def _broker_client() -> redis.Redis:
+    """Return a per-process Redis client for the broker database."""
+    return redis.Redis.from_url(app.conf.broker_url)
+
+
+@functools.cache
+def _inflight_decr() -> Any:
+    """Return the registered counter-decrement script."""
+    return _broker_client().register_script(_DECR_IF_PRESENT)
+
+
+@task_postrun.connect
+def _decrement_inflight(sender: Any = None, state: str | None = None, **_: Any) -> None:
+    """Count a task as done once it reaches a final state (retries stay in flight).
+
+    Only tasks declared with ``track_inflight=True`` (those dispatched by the scenarios
+    that SET the counter) pay for the round trip; every other task returns immediately.
+    """
+    if not getattr(sender, "track_inflight", False) or state not in states.READY_STATES:
+        return
+    try:
+        _inflight_decr()(keys=[INFLIGHT_KEY])
+    except redis.RedisError:
+        # Benchmark falls back to its timeout if the counter cannot be updated
+        pass
+
 
 # ============================================================================
 # Scenario 1: Basic Throughput - Minimal Tasks
 # ============================================================================
 
+_PROCESSED_PREFIX = "Processed: "
+
 
 @app.task(ignore_result=True)  # Disable result backend for throughput test
 def noop_task() -> None:
@@ -49,7 +103,7 @@ def noop_task() -> None:
 @app.task
 def simple_logging_task(message: str) -> str:
     """Simple task that returns the message (minimal processing)."""
-    return f"Processed: {message}"
+    return _PROCESSED_PREFIX + message
 
 
 # ============================================================================
@@ -57,7 +111,38 @@ def simple_logging_task(message: str) -> str:
 # ============================================================================
 
 
-@app.task
+# Per-process HTTP limits mirror the AsyncTasQ shared client (512 connections, 256 kept
+# alive) so neither framework's I/O tasks are throttled by a smaller pool
+_HTTP_MAX_CONCURRENCY = 512
+_HTTP_KEEPALIVE_CONNECTIONS = 256
+
+
+@functools.cache
+def _http_session() -> requests.Session:
+    """Return a per-process keep-alive session shared by the HTTP tasks.
+
+    Created lazily so prefork children don't inherit the parent's sockets; the
+    urllib3 pool behind it is thread-safe, so thread-pool workers share it too.
+    """
+    session = requests.Session()
+    session.mount(
+        "http://", HTTPAdapter(pool_connections=4, pool_maxsize=_HTTP_KEEPALIVE_CONNECTIONS)
+    )
+    return session
+
+
+@functools.cache
+def _fanout_executor() -> ThreadPoolExecutor:
+    """Return a per-process thread pool for in-task HTTP fan-out.
+
+    Reused across tasks so threads aren't spawned per call (threads start on demand up
+    to the cap). Socket reads release the GIL, so the requests overlap under both the
+    prefork and threads worker pools.
+    """
+    return ThreadPoolExecutor(max_workers=_HTTP_MAX_CONCURRENCY, thread_name_prefix="http-fanout")
+
+
+@app.task(track_inflight=True)
 def fetch_user_http(user_id: int, base_url: str = "http://localhost:8080") -> dict[str, Any]:
     """Fetch user data from mock API (sync HTTP I/O).
 
@@ -71,7 +156,7 @@ def fetch_user_http(user_id: int, base_url: str = "http://localhost:8080") -> di
     Returns:
         User data from API
     """
-    response = requests.get(f"{base_url}/users/{user_id}?latency=100", timeout=10)
+    response = _http_session().get(f"{base_url}/users/{user_id}?latency=100", timeout=10)
     response.raise_for_status()
     return response.json()
 
@@ -87,17 +172,17 @@ def fetch_order_http(order_id: int, base_url: str = "http://localhost:8080") ->
     Returns:
         Order data from API
     """
-    response = requests.get(f"{base_url}/orders/{order_id}?latency=150", timeout=10)
+    response = _http_session().get(f"{base_url}/orders/{order_id}?latency=150", timeout=10)
     response.raise_for_status()
     return response.json()
 
 
 @app.task
 def concurrent_http_requests(num_requests: int = 10) -> list[dict[str, Any]]:
-    """Make multiple HTTP requests sequentially (Celery limitation).
+    """Make multiple HTTP requests concurrently on a thread pool.
 
     Note: Unlike AsyncTasQ which uses asyncio.gather for true concurrency,
-    Celery requires sequential requests or manual threading.
+    Celery's sync tasks need manual threading to overlap the requests.
 
     Args:
         num_requests: Number of requests to make
@@ -105,11 +190,12 @@ def concurrent_http_requests(num_requests: int = 10) -> list[dict[str, Any]]:
     Returns:
         List of responses
     """
-    results = []
-    for i in range(num_requests):
-        response = requests.get(f"http://localhost:8080/users/{i}?latency=50", timeout=10)
-        results.append(response.json())
-    return results
+    session = _http_session()
+
+    def fetch(i: int) -> dict[str, Any]:
+        return session.get(f"http://localhost:8080/users/{i}?latency=50", timeout=10).json()
+
+    return list(_fanout_executor().map(fetch, range(num_requests)))
 
 
 # ============================================================================
@@ -117,6 +203,12 @@ def concurrent_http_requests(num_requests: int = 10) -> list[dict[str, Any]]:
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=4)
+def _load_shared_payload(payload_key: str) -> bytes:
+    """Fetch a payload uploaded once by the benchmark (cached per worker process)."""
+    return fetch_payload(_broker_client(), payload_key)
+
+
 @app.task
 def parse_json_sync(json_string: str) -> dict[str, Any]:
     """Parse JSON (light CPU work).
@@ -127,7 +219,7 @@ def parse_json_sync(json_string: str) -> dict[str, Any]:
     Returns:
         Parsed dictionary
     """
-    return json.loads(json_string)
+    return from_json(json_string)
 
 
 @app.task
@@ -143,14 +235,16 @@ def compute_factorial_sync(number: int) -> int:
     Returns:
         Factorial result
     """
-    result = 1
-    for i in range(1, number + 1):
-        result *= i
-    return result
+    return math.factorial(number)
 
 
 @app.task
-def compute_hash_process(data: bytes, iterations: int = 100000) -> str:
+def compute_hash_process(
+    data: bytes = b"",
+    iterations: int = 100000,
+    payload_key: str | None = None,
+    algorithm: str = "pbkdf2_sha256",
+) -> str:
     """Compute PBKDF2 hash (heavy CPU work).
 
     Best with prefork workers (multiprocessing).
@@ -159,12 +253,15 @@ def compute_hash_process(data: bytes, iterations: int = 100000) -> str:
     Args:
         data: Data to hash
         iterations: Number of PBKDF2 iterations
+        payload_key: Redis key of a shared payload to hash instead of ``data``
+        algorithm: ``"pbkdf2_sha256"`` (default) or ``"blake2b"`` for a lighter keyed hash
 
     Returns:
         Hexadecimal hash string
     """
-    result = hashlib.pbkdf2_hmac("sha256", data, b"salt", iterations)
-    return result.hex()
+    if payload_key is not None:
+        data = _load_shared_payload(payload_key)
+    return compute_hash(data, iterations, algorithm)
 
 
 @app.task
@@ -187,23 +284,27 @@ def hash_data_heavy_process(data: bytes) -> str:
 # ============================================================================
 
 
-@app.task
+@app.task(track_inflight=True)
 def mixed_io_task(task_id: int) -> str:
     """Light I/O task (60% of mixed workload)."""
-    response = requests.get(f"http://localhost:8080/users/{task_id}?latency=50", timeout=10)
+    response = _http_session().get(f"http://localhost:8080/users/{task_id}?latency=50", timeout=10)
     return response.json()["name"]
 
 
-@app.task
+@app.task(track_inflight=True)
 def mixed_cpu_light(data: str) -> dict[str, Any]:
     """Light CPU task (30% of mixed workload) - JSON parsing."""
-    return json.loads(data)
+    return from_json(data)
 
 
-@app.task
-def mixed_cpu_heavy(data: bytes) -> str:
-    """Heavy CPU task (10% of mixed workload) - hashing."""
-    return hashlib.sha256(data).hexdigest()
+@app.task(track_inflight=True)
+def mixed_cpu_heavy(payload_key: str) -> str:
+    """Heavy CPU task (10% of mixed workload) - hashing.
+
+    The payload is read from the broker Redis by key instead of being
+    serialized into every task message.
+    """
+    return hashlib.sha256(_load_shared_payload(payload_key)).hexdigest()
 
 
 # ============================================================================
@@ -221,35 +322,16 @@ def small_payload_task(data: dict[str, Any]) -> dict[str, Any]:
 def large_payload_task(data: dict[str, Any]) -> int:
     """Task with large nested payload (tests serialization efficiency).
 
-    Note: Celery uses JSON by default, which is less efficient than
-    AsyncTasQ's msgpack. Pickle can be used but has security concerns.
+    Note: This app serializes with msgpack (Celery's stock default is JSON), so the
+    payload travels in the same wire format as AsyncTasQ's.
     """
-
-    def count_items(obj: Any) -> int:
-        if isinstance(obj, dict):
-            return sum(count_items(v) for v in obj.values())
-        elif isinstance(obj, list):
-            return sum(count_items(v) for v in obj)
-        return 1
-
-    return count_items(data)
+    return count_leaves(data)
 
 
 @app.task
-def binary_payload_task(data_hex: str) -> str:
-    """Task with binary payload (JSON-encoded as hex string).
-
-    Note: Celery's JSON serializer requires base64/hex encoding for binary.
-    AsyncTasQ's msgpack handles binary natively (more efficient).
-
-    Args:
-        data_hex: Hexadecimal-encoded binary data
-
-    Returns:
-        MD5 hash of data
-    """
-    data = bytes.fromhex(data_hex)
-    return hashlib.md5(data).hexdigest()
+def binary_payload_task(data: bytes) -> str:
+    """Task with binary payload (tests msgpack binary efficiency)."""
+    return checksum(data)
 
 
 # ============================================================================
@@ -257,10 +339,8 @@ def binary_payload_task(data_hex: str) -> str:
 # ============================================================================
 
 
-@app.task
-def validate_order(order_id: int) -> dict[str, Any]:
-    """Step 1: Validate order data."""
-    response = requests.get(f"http://localhost:8080/orders/{order_id}", timeout=10)
+def _fetch_validated_order(order_id: int) -> dict[str, Any]:
+    response = _http_session().get(f"http://localhost:8080/orders/{order_id}", timeout=10)
     order = response.json()
 
     # Simple validation
@@ -270,6 +350,18 @@ def validate_order(order_id: int) -> dict[str, Any]:
     return order
 
 
+# Opt-in LRU of validated orders (the mock API is deterministic per id); off by default
+# so the pipeline keeps measuring real I/O unless repeated-order reuse is being studied
+if os.getenv("BENCH_CACHE_ORDERS"):
+    _fetch_validated_order = functools.lru_cache(maxsize=4096)(_fetch_validated_order)
+
+
+@app.task
+def validate_order(order_id: int) -> dict[str, Any]:
+    """Step 1: Validate order data."""
+    return _fetch_validated_order(order_id)
+
+
 @app.task(bind=True, max_retries=3)
 def charge_payment(
     self,
@@ -283,7 +375,7 @@ def charge_payment(
     AsyncTasQ has built-in retry logic in Task base class.
     """
     try:
-        response = requests.get(
+        response = _http_session().get(
             f"http://localhost:8080/error-simulation?error_rate={error_rate}&latency=200",
             timeout=10,
         )
@@ -296,8 +388,9 @@ def charge_payment(
             "transaction_id": f"txn_{order_id}",
         }
     except requests.exceptions.HTTPError as exc:
-        # Retry on error
-        raise self.retry(exc=exc, countdown=2) from exc
+        # Retry with exponential backoff plus jitter so failed charges don't re-enqueue in lockstep
+        countdown = min(2**self.request.retries + random.random(), 30)
+        raise self.retry(exc=exc, countdown=countdown) from exc
 
 
 @app.task
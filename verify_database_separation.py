@@ -0,0 +1,73 @@
+"""Verify AsyncTasQ and Celery use separate Redis databases.
+
+AsyncTasQ must use DB 0 while Celery uses DB 1 (broker) and DB 2 (results);
+sharing a database lets workers consume each other's messages.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+from urllib.parse import urlparse
+
+import redis
+from rich.console import Console
+
+console = Console()
+
+# SCAN (non-blocking, batched) is capped so large databases can't stall verification
+SCAN_BATCH = 1000
+SCAN_LIMIT = 10_000
+SAMPLE_KEYS = 5
+
+
+def _location(url: str) -> tuple[str, int]:
+    """Return ``(host:port, db)`` for a redis:// URL."""
+    parsed = urlparse(url)
+    path = parsed.path.lstrip("/")
+    return parsed.netloc.rpartition("@")[2], int(path) if path else 0
+
+
+def check_redis_keys(name: str, url: str) -> int:
+    """Print the key count and a few sample keys for ``url``; return the (capped) count."""
+    client = redis.Redis.from_url(url, decode_responses=False)
+    try:
+        keys = list(itertools.islice(client.scan_iter(match="*", count=SCAN_BATCH), SCAN_LIMIT))
+    finally:
+        client.close()
+
+    suffix = "+" if len(keys) == SCAN_LIMIT else ""
+    console.print(f"  {name} (DB {_location(url)[1]}): {len(keys)}{suffix} keys")
+    # Only the printed samples are decoded
+    for key in keys[:SAMPLE_KEYS]:
+        console.print(f"    [dim]- {key.decode(errors='replace')}[/dim]")
+    return len(keys)
+
+
+def main() -> int:
+    targets = {
+        "AsyncTasQ": os.getenv("ASYNCTASQ_REDIS_URL", "redis://localhost:6379/0"),
+        "Celery broker": os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1"),
+        "Celery backend": os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/2"),
+    }
+
+    locations = {name: _location(url) for name, url in targets.items()}
+    if len(set(locations.values())) != len(locations):
+        console.print("[bold red]✗ Redis databases overlap:[/bold red]")
+        for name, (host, db) in locations.items():
+            console.print(f"  {name}: {host} DB {db}")
+        return 1
+    console.print("[green]✓ AsyncTasQ and Celery use separate Redis databases[/green]")
+
+    try:
+        for name, url in targets.items():
+            check_redis_keys(name, url)
+    except redis.exceptions.ConnectionError as exc:
+        console.print(f"[bold red]✗ Could not connect to Redis: {exc}[/bold red]")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())